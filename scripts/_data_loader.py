@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Ortak veri yükleyici (shared data loader)
+OWID CSV'leri bir kez parse edip süreç içinde ve diskte önbelleğe alır
+"""
+
+import functools
+from pathlib import Path
+
+import pandas as pd
+
+
+@functools.lru_cache(maxsize=4)
+def load_owid(path, columns, dtypes=None):
+    """Load an OWID energy CSV, or its fresh Parquet twin.
+
+    Prefers ``<path>.parquet`` next to the CSV when it is at least as
+    new, so repeat runs skip text parsing entirely; on a miss the CSV is
+    parsed once (projected to ``columns``, typed at parse time) and a
+    full Parquet copy is written for the next run. Results are also
+    cached in-process via lru_cache — callers share the returned frame
+    and must not mutate it.
+
+    ``columns`` is a tuple of column names; ``dtypes`` an optional tuple
+    of (column, dtype) pairs (tuples, because lru_cache keys must hash).
+    """
+    path = Path(path)
+    columns = list(columns)
+    dtype_map = dict(dtypes) if dtypes else None
+
+    parquet = path.with_suffix('.parquet')
+    try:
+        if parquet.stat().st_mtime >= path.stat().st_mtime:
+            df = pd.read_parquet(parquet, columns=columns)
+            return df.astype(dtype_map) if dtype_map else df
+    except (ImportError, OSError):
+        pass
+
+    try:
+        df = pd.read_csv(path, usecols=columns, dtype=dtype_map, engine='pyarrow')
+    except ImportError:
+        df = pd.read_csv(path, usecols=columns, dtype=dtype_map)
+
+    # Convert the whole file once so later runs — and the other scripts,
+    # whatever columns they project — never touch the CSV again.
+    try:
+        import pyarrow.csv as pacsv
+        import pyarrow.parquet as pq
+        pq.write_table(pacsv.read_csv(path), parquet, compression='zstd')
+    except (ImportError, OSError):
+        pass
+
+    return df
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Ortak grafik stili (shared plot styling)
+Backend, rcParams ve seaborn temasını tek seferde kurar
+"""
+
+import os
+
+import matplotlib
+matplotlib.use('Agg')  # select the raster backend before pyplot loads
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+# Turkish character support and visual settings. sns.set_theme resolves
+# styles and rebuilds the font manager, which is the expensive part of
+# figure setup — importing this module pays that once per process
+# instead of once per script.
+plt.rcParams['font.family'] = 'DejaVu Sans'
+plt.rcParams['font.size'] = 10
+# Cheaper Agg rasterization: drop sub-threshold vertices and feed long
+# paths to the renderer in chunks.
+plt.rcParams.update({'path.simplify': True, 'path.simplify_threshold': 1.0,
+                     'agg.path.chunksize': 10000})
+sns.set_theme(style='whitegrid', palette='husl')
+
+# The two-region husl palette, resolved once; pass PALETTE[i] straight
+# to plot calls instead of letting seaborn re-resolve it per call.
+PALETTE = sns.color_palette('husl', 2)
+
+# Rasterization and PNG-encode cost scale with pixel count; 150 dpi is
+# plenty for on-screen review, and REPORT_DPI=300 restores print quality.
+REPORT_DPI = int(os.environ.get('REPORT_DPI', 150))
@@ -4,97 +4,173 @@ Gelişmiş Enerji Politikaları Analizi ve Görselleştirme
 EU27 vs ABD: Nükleer ve Yenilenebilir Enerji Karşılaştırması
 """
 
+import os
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
-# Türkçe karakter desteği ve görsel ayarlar
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['font.size'] = 10
-sns.set_theme(style='whitegrid', palette='husl')
+_PLOT_READY = False
+
+
+def _setup_plotting():
+    """matplotlib/seaborn'u ilk çizim isteğinde yükle
+
+    Modül yalnızca veri incelemesi için içe aktarıldığında grafik
+    kütüphanelerinin ~1 saniyelik import maliyeti ödenmez.
+    """
+    global plt, sns, PCT_FMT, _PLOT_READY
+    if _PLOT_READY:
+        return
+    import matplotlib.pyplot
+    import seaborn
+    from matplotlib.ticker import PercentFormatter
+    plt = matplotlib.pyplot
+    sns = seaborn
+    # Tüm eksenlerde paylaşılan tek yüzde biçimlendirici
+    PCT_FMT = PercentFormatter(xmax=100, decimals=1)
+
+    # Türkçe karakter desteği ve görsel ayarlar
+    plt.rcParams['font.family'] = 'DejaVu Sans'
+    plt.rcParams['font.size'] = 10
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    sns.set_theme(style='whitegrid', palette='husl')
+    _PLOT_READY = True
+
+# Analizde kullanılan kolonlar ve dtyplar (float64 yerine float32 yeterli)
+USECOLS = ['region', 'year', 'nuclear_share_energy', 'renewables_share_energy',
+           'fossil_share_energy', 'low_carbon_share_energy']
+DTYPES = {'year': 'float32',
+          'nuclear_share_energy': 'float32',
+          'renewables_share_energy': 'float32',
+          'fossil_share_energy': 'float32',
+          'low_carbon_share_energy': 'float32'}
 
 class EnergyPolicyAnalyzer:
     def __init__(self, data_path: str = None):
         """Enerji politikası analizörü başlat"""
         if data_path is None:
             data_path = Path(__file__).parent.parent / 'data' / 'processed' / 'eu_us_energy.csv'
-        
-        self.df = pd.read_csv(data_path)
-        self.df['year'] = pd.to_numeric(self.df['year'], errors='coerce')
+
+        self.df = self._load_dataframe(Path(data_path))
         self.df = self.df.dropna(subset=['year'])
+        # 1900-2024 aralığı int16'ya sığar; float64 eksen dizilerine gerek yok
+        self.df['year'] = self.df['year'].astype(np.int16)
         
-        # Modern dönem (1960 sonrası)
-        self.modern_df = self.df[self.df['year'] >= 1960].copy()
-        
-        # Son 20 yıl
-        self.recent_df = self.df[self.df['year'] >= 2000].copy()
-        
+        # Modern dönem (1960 sonrası) ve son 20 yıl; hiçbir yerde yerinde
+        # değiştirilmedikleri için kopyasız dilimler yeterli
+        self.modern_df = self.df[self.df['year'] >= 1960]
+        self.recent_df = self.df[self.df['year'] >= 2000]
+
+        # Tüm çizgi grafikleri tek geniş tablodan beslenir: bir pivot,
+        # sekiz ayrı filtre taramasının yerini alır
+        self._wide = self.modern_df.pivot_table(
+            index='year', columns='region',
+            values=['nuclear_share_energy', 'renewables_share_energy',
+                    'low_carbon_share_energy', 'fossil_share_energy'])
+
+        # 2024 satırlarını tek seferde sözlüğe çıkar; hem enerji karışımı
+        # grafiği hem istatistiksel özet aynı değerleri okur
+        self._mix_2024 = (self.df[self.df['year'] == 2024]
+                          .set_index('region')
+                          .to_dict('index'))
+
         print("✅ Veri yüklendi!")
         print(f"📊 Toplam kayıt: {len(self.df)}")
         print(f"📅 Yıl aralığı: {self.df['year'].min():.0f} - {self.df['year'].max():.0f}")
         print(f"🌍 Bölgeler: {', '.join(self.df['region'].unique())}")
-    
-    def create_comprehensive_analysis(self):
-        """Kapsamlı analiz ve görselleştirme"""
+
+    @staticmethod
+    def _load_dataframe(data_path: Path) -> pd.DataFrame:
+        """CSV'yi yükle; tekrar eden çalıştırmalar için Parquet önbelleği kullan"""
+        parquet_path = data_path.with_suffix('.parquet')
+        if (parquet_path.exists()
+                and parquet_path.stat().st_mtime >= data_path.stat().st_mtime):
+            return pd.read_parquet(parquet_path, columns=USECOLS)
+
+        try:
+            # PyArrow'un çok çekirdekli CSV okuyucusu varsa onu kullan
+            df = pd.read_csv(data_path, usecols=USECOLS, dtype=DTYPES,
+                             engine='pyarrow')
+        except ImportError:
+            df = pd.read_csv(data_path, usecols=USECOLS, dtype=DTYPES)
+        # Kategorik bölge kolonu: '== EU27' karşılaştırmaları int8 kod üzerinden çalışır
+        df['region'] = df['region'].astype('category')
+
+        try:
+            df.to_parquet(parquet_path, compression='zstd')
+        except (ImportError, OSError):
+            pass  # önbellek yazılamazsa CSV'den okumaya devam edilir
+        return df
+
+    def create_comprehensive_analysis(self, show=None):
+        """Kapsamlı analiz ve görselleştirme
+
+        show=None iken ekran yalnızca bir görüntü sunucusu varsa açılır;
+        başsız (CI/sunucu) çalıştırmalarda GUI maliyeti hiç ödenmez.
+        """
         print("\n🚀 Kapsamlı analiz başlatılıyor...")
-        
-        # Ana grafik düzeni
-        fig = plt.figure(figsize=(20, 24))
-        fig.suptitle('🌍 EU27 vs ABD: Kapsamlı Enerji Politikaları Analizi (1960-2024)', 
+        _setup_plotting()
+        if show is None:
+            show = bool(os.environ.get('DISPLAY'))
+        
+        # Ana grafik düzeni: constrained layout eksenler eklenirken
+        # konumlanır, sondaki ek tight_layout geçişine gerek kalmaz
+        fig = plt.figure(figsize=(20, 24), layout='constrained')
+        fig.suptitle('🌍 EU27 vs ABD: Kapsamlı Enerji Politikaları Analizi (1960-2024)',
                      fontsize=20, fontweight='bold', y=0.98)
-        
+        gs = fig.add_gridspec(4, 2)
+
         # 1. Nükleer Enerji Trendi
-        self._plot_nuclear_trends(fig, 1)
-        
+        self._plot_nuclear_trends(fig.add_subplot(gs[0, 0]))
+
         # 2. Yenilenebilir Enerji Gelişimi
-        self._plot_renewables_development(fig, 2)
-        
+        self._plot_renewables_development(fig.add_subplot(gs[0, 1]))
+
         # 3. Düşük Karbon Geçişi
-        self._plot_low_carbon_transition(fig, 3)
-        
+        self._plot_low_carbon_transition(fig.add_subplot(gs[1, 0]))
+
         # 4. Fosil Yakıt Kullanımı
-        self._plot_fossil_fuel_usage(fig, 4)
-        
+        self._plot_fossil_fuel_usage(fig.add_subplot(gs[1, 1]))
+
         # 5. Enerji Karışımı Karşılaştırması
-        self._plot_energy_mix_comparison(fig, 5)
-        
+        self._plot_energy_mix_comparison(fig.add_subplot(gs[2, 0]))
+
         # 6. Trend Analizi ve Tahminler
-        self._plot_trend_analysis(fig, 6)
-        
+        self._plot_trend_analysis(fig.add_subplot(gs[2, 1]))
+
         # 7. Performans Metrikleri
-        self._plot_performance_metrics(fig, 7)
-        
+        self._plot_performance_metrics(fig.add_subplot(gs[3, 0]))
+
         # 8. Politika Değerlendirmesi
-        self._plot_policy_evaluation(fig, 8)
-        
-        plt.tight_layout()
-        
+        self._plot_policy_evaluation(fig.add_subplot(gs[3, 1]))
+
         # Grafikleri kaydet
         output_path = Path(__file__).parent.parent / 'reports' / 'comprehensive_energy_analysis.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        # 150 dpi 20x24 inçlik figür için yeterli; piksel sayısı (ve Agg
+        # rasterleştirme + PNG sıkıştırma süresi) 300 dpi'ın dörtte biri
+        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white',
+                    pil_kwargs={'compress_level': 1})
         print(f"📈 Kapsamlı analiz grafiği kaydedildi: {output_path}")
-        
-        plt.show()
-        
+
+        if show:
+            plt.show()
+        # 150 dpi'da bile figürün RGBA tamponu onlarca MB; hemen bırak
+        plt.close(fig)
+
         # İstatistiksel özet
         self._print_statistical_summary()
         
         # Politika önerileri
         self._print_policy_recommendations()
     
-    def _plot_nuclear_trends(self, fig, position):
+    def _plot_nuclear_trends(self, ax):
         """Nükleer enerji trendleri"""
-        ax = fig.add_subplot(4, 2, position)
         
-        # Ana trend çizgileri
-        for region in ['EU27', 'US']:
-            data = self.modern_df[self.modern_df['region'] == region]
-            ax.plot(data['year'], data['nuclear_share_energy'], 
-                   linewidth=3, marker='o', markersize=4, label=region)
+        # Ana trend çizgileri (iki bölge tek çağrıda)
+        self._wide['nuclear_share_energy'].plot(
+            ax=ax, linewidth=3, marker='o', markersize=4)
         
         # Fukushima etkisi (2011)
         ax.axvline(x=2011, color='red', linestyle='--', alpha=0.7, 
@@ -108,16 +184,13 @@ class EnergyPolicyAnalyzer:
         ax.grid(True, alpha=0.3)
         
         # Yüzde işaretleri
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1f}%'))
+        ax.yaxis.set_major_formatter(PCT_FMT)
     
-    def _plot_renewables_development(self, fig, position):
+    def _plot_renewables_development(self, ax):
         """Yenilenebilir enerji gelişimi"""
-        ax = fig.add_subplot(4, 2, position)
         
-        for region in ['EU27', 'US']:
-            data = self.modern_df[self.modern_df['region'] == region]
-            ax.plot(data['year'], data['renewables_share_energy'], 
-                   linewidth=3, marker='s', markersize=4, label=region)
+        self._wide['renewables_share_energy'].plot(
+            ax=ax, linewidth=3, marker='s', markersize=4)
         
         # Paris Anlaşması (2015)
         ax.axvline(x=2015, color='green', linestyle='--', alpha=0.7, 
@@ -129,16 +202,13 @@ class EnergyPolicyAnalyzer:
         ax.set_xlabel('Yıl')
         ax.legend()
         ax.grid(True, alpha=0.3)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1f}%'))
+        ax.yaxis.set_major_formatter(PCT_FMT)
     
-    def _plot_low_carbon_transition(self, fig, position):
+    def _plot_low_carbon_transition(self, ax):
         """Düşük karbon geçişi"""
-        ax = fig.add_subplot(4, 2, position)
         
-        for region in ['EU27', 'US']:
-            data = self.modern_df[self.modern_df['region'] == region]
-            ax.plot(data['year'], data['low_carbon_share_energy'], 
-                   linewidth=3, marker='^', markersize=4, label=region)
+        self._wide['low_carbon_share_energy'].plot(
+            ax=ax, linewidth=3, marker='^', markersize=4)
         
         # 2050 hedefi çizgisi
         ax.axhline(y=50, color='orange', linestyle='--', alpha=0.7, 
@@ -149,16 +219,13 @@ class EnergyPolicyAnalyzer:
         ax.set_xlabel('Yıl')
         ax.legend()
         ax.grid(True, alpha=0.3)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1f}%'))
+        ax.yaxis.set_major_formatter(PCT_FMT)
     
-    def _plot_fossil_fuel_usage(self, fig, position):
+    def _plot_fossil_fuel_usage(self, ax):
         """Fosil yakıt kullanımı"""
-        ax = fig.add_subplot(4, 2, position)
         
-        for region in ['EU27', 'US']:
-            data = self.modern_df[self.modern_df['region'] == region]
-            ax.plot(data['year'], data['fossil_share_energy'], 
-                   linewidth=3, marker='d', markersize=4, label=region)
+        self._wide['fossil_share_energy'].plot(
+            ax=ax, linewidth=3, marker='d', markersize=4)
         
         # 2050 hedefi çizgisi
         ax.axhline(y=50, color='red', linestyle='--', alpha=0.7, 
@@ -169,26 +236,21 @@ class EnergyPolicyAnalyzer:
         ax.set_xlabel('Yıl')
         ax.legend()
         ax.grid(True, alpha=0.3)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1f}%'))
+        ax.yaxis.set_major_formatter(PCT_FMT)
     
-    def _plot_energy_mix_comparison(self, fig, position):
+    def _plot_energy_mix_comparison(self, ax):
         """Enerji karışımı karşılaştırması"""
-        ax = fig.add_subplot(4, 2, position)
-        
-        # 2024 verileri
-        latest_data = self.df[self.df['year'] == 2024]
         
+        # 2024 verileri (init'te hazırlanan sözlükten)
         categories = ['Nükleer', 'Yenilenebilir', 'Fosil']
-        eu_values = [
-            latest_data[latest_data['region'] == 'EU27']['nuclear_share_energy'].iloc[0],
-            latest_data[latest_data['region'] == 'EU27']['renewables_share_energy'].iloc[0],
-            latest_data[latest_data['region'] == 'EU27']['fossil_share_energy'].iloc[0]
-        ]
-        us_values = [
-            latest_data[latest_data['region'] == 'US']['nuclear_share_energy'].iloc[0],
-            latest_data[latest_data['region'] == 'US']['renewables_share_energy'].iloc[0],
-            latest_data[latest_data['region'] == 'US']['fossil_share_energy'].iloc[0]
-        ]
+        eu_2024 = self._mix_2024['EU27']
+        us_2024 = self._mix_2024['US']
+        eu_values = [eu_2024['nuclear_share_energy'],
+                     eu_2024['renewables_share_energy'],
+                     eu_2024['fossil_share_energy']]
+        us_values = [us_2024['nuclear_share_energy'],
+                     us_2024['renewables_share_energy'],
+                     us_2024['fossil_share_energy']]
         
         x = np.arange(len(categories))
         width = 0.35
@@ -205,51 +267,38 @@ class EnergyPolicyAnalyzer:
         ax.grid(True, alpha=0.3)
         
         # Değerleri çubukların üzerine yaz
-        for bar in bars1:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                   f'{height:.1f}%', ha='center', va='bottom', fontweight='bold')
-        
-        for bar in bars2:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                   f'{height:.1f}%', ha='center', va='bottom', fontweight='bold')
-    
-    def _plot_trend_analysis(self, fig, position):
+        ax.bar_label(bars1, fmt='%.1f%%', padding=3, fontweight='bold')
+        ax.bar_label(bars2, fmt='%.1f%%', padding=3, fontweight='bold')
+
+    def _plot_trend_analysis(self, ax):
         """Trend analizi ve tahminler"""
-        ax = fig.add_subplot(4, 2, position)
         
-        # Son 10 yıl trendi
+        # Son 10 yıl trendi: bölgeler kolonlara açılır, tüm lineer
+        # regresyonlar tek polyfit çağrısında çözülür
         recent_data = self.df[self.df['year'] >= 2015]
-        
-        for region in ['EU27', 'US']:
-            region_data = recent_data[recent_data['region'] == region]
-            
-            # Yenilenebilir trend
-            x = region_data['year']
-            y = region_data['renewables_share_energy']
-            
-            # Basit lineer regresyon
-            z = np.polyfit(x, y, 1)
-            p = np.poly1d(z)
-            
-            ax.plot(x, y, 'o-', linewidth=2, markersize=6, label=f'{region} (Gerçek)')
-            ax.plot(x, p(x), '--', linewidth=2, alpha=0.7, label=f'{region} (Trend)')
+        pivot = (recent_data.pivot(index='year', columns='region',
+                                   values='renewables_share_energy')
+                 .sort_index())
+        x = pivot.index.to_numpy(dtype=float)
+        coefs = np.polynomial.polynomial.polyfit(x, pivot.to_numpy(dtype=float), 1)
+
+        for i, region in enumerate(pivot.columns):
+            ax.plot(x, pivot.iloc[:, i], 'o-', linewidth=2, markersize=6,
+                    label=f'{region} (Gerçek)')
+            ax.plot(x, np.polynomial.polynomial.polyval(x, coefs[:, i]), '--',
+                    linewidth=2, alpha=0.7, label=f'{region} (Trend)')
         
         ax.set_title('📈 Yenilenebilir Enerji Trend Analizi (2015-2024)', fontsize=14, fontweight='bold')
         ax.set_ylabel('Birincil Enerji Payı (%)')
         ax.set_xlabel('Yıl')
         ax.legend()
         ax.grid(True, alpha=0.3)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1f}%'))
+        ax.yaxis.set_major_formatter(PCT_FMT)
     
-    def _plot_performance_metrics(self, fig, position):
+    def _plot_performance_metrics(self, ax):
         """Performans metrikleri"""
-        ax = fig.add_subplot(4, 2, position)
         
         # 2024 performans karşılaştırması
-        latest_data = self.df[self.df['year'] == 2024]
-        
         metrics = ['Nükleer', 'Yenilenebilir', 'Düşük Karbon', 'Fosil Azaltım']
         eu_scores = [10.1, 22.3, 32.4, 32.4]  # Son değer fosil azaltım
         us_scores = [7.6, 12.1, 19.7, 19.7]
@@ -269,19 +318,11 @@ class EnergyPolicyAnalyzer:
         ax.grid(True, alpha=0.3)
         
         # Değerleri çubukların üzerine yaz
-        for bar in bars1:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                   f'{height:.1f}%', ha='center', va='bottom', fontweight='bold')
-        
-        for bar in bars2:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                   f'{height:.1f}%', ha='center', va='bottom', fontweight='bold')
-    
-    def _plot_policy_evaluation(self, fig, position):
+        ax.bar_label(bars1, fmt='%.1f%%', padding=3, fontweight='bold')
+        ax.bar_label(bars2, fmt='%.1f%%', padding=3, fontweight='bold')
+
+    def _plot_policy_evaluation(self, ax):
         """Politika değerlendirmesi"""
-        ax = fig.add_subplot(4, 2, position)
         
         # Politika alanları ve puanlar
         policy_areas = ['Nükleer Desteği', 'Yenilenebilir Teşvik', 'Karbon Azaltım', 'Politika Tutarlılığı']
@@ -306,15 +347,8 @@ class EnergyPolicyAnalyzer:
         ax.grid(True, alpha=0.3)
         
         # Değerleri çubukların üzerine yaz
-        for bar in bars1:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.2,
-                   f'{height:.1f}', ha='center', va='bottom', fontweight='bold')
-        
-        for bar in bars2:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.2,
-                   f'{height:.1f}', ha='center', va='bottom', fontweight='bold')
+        ax.bar_label(bars1, fmt='%.1f', padding=3, fontweight='bold')
+        ax.bar_label(bars2, fmt='%.1f', padding=3, fontweight='bold')
     
     def _print_statistical_summary(self):
         """İstatistiksel özet yazdır"""
@@ -322,26 +356,23 @@ class EnergyPolicyAnalyzer:
         print("📊 İSTATİSTİKSEL ÖZET")
         print("="*80)
         
-        latest_data = self.df[self.df['year'] == 2024]
-        
         for region in ['EU27', 'US']:
-            region_data = latest_data[latest_data['region'] == region]
+            region_data = self._mix_2024[region]
             print(f"\n🌍 {region} - 2024:")
-            print(f"   Nükleer Enerji: {region_data['nuclear_share_energy'].iloc[0]:.1f}%")
-            print(f"   Yenilenebilir: {region_data['renewables_share_energy'].iloc[0]:.1f}%")
-            print(f"   Düşük Karbon: {region_data['low_carbon_share_energy'].iloc[0]:.1f}%")
-            print(f"   Fosil Yakıt: {region_data['fossil_share_energy'].iloc[0]:.1f}%")
-        
-        # Trend analizi
+            print(f"   Nükleer Enerji: {region_data['nuclear_share_energy']:.1f}%")
+            print(f"   Yenilenebilir: {region_data['renewables_share_energy']:.1f}%")
+            print(f"   Düşük Karbon: {region_data['low_carbon_share_energy']:.1f}%")
+            print(f"   Fosil Yakıt: {region_data['fossil_share_energy']:.1f}%")
+
+        # Trend analizi: tüm bölgelerin son-ilk farkları tek groupby ile
         print(f"\n📈 Trend Analizi (2015-2024):")
+        delta = (self.recent_df.groupby('region', observed=True)
+                 [['nuclear_share_energy', 'renewables_share_energy']]
+                 .agg(lambda s: s.iloc[-1] - s.iloc[0]))
         for region in ['EU27', 'US']:
-            region_data = self.recent_df[self.recent_df['region'] == region]
-            nuclear_change = region_data.iloc[-1]['nuclear_share_energy'] - region_data.iloc[0]['nuclear_share_energy']
-            renewables_change = region_data.iloc[-1]['renewables_share_energy'] - region_data.iloc[0]['renewables_share_energy']
-            
             print(f"   {region}:")
-            print(f"     Nükleer: {nuclear_change:+.1f}%")
-            print(f"     Yenilenebilir: {renewables_change:+.1f}%")
+            print(f"     Nükleer: {delta.at[region, 'nuclear_share_energy']:+.1f}%")
+            print(f"     Yenilenebilir: {delta.at[region, 'renewables_share_energy']:+.1f}%")
     
     def _print_policy_recommendations(self):
         """Politika önerileri yazdır"""
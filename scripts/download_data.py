@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 import requests
 
 
 DATA_DIR = Path(__file__).resolve().parents[1] / "data" / "raw"
+ETAG_CACHE = DATA_DIR / ".etags.json"
+CHUNK_SIZE = 1 << 20  # 1 MiB
 
 DATASETS: Dict[str, str] = {
     "owid-energy-data.csv": "https://raw.githubusercontent.com/owid/energy-data/master/owid-energy-data.csv",
@@ -20,22 +24,70 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def download_file(url: str, dest: Path) -> None:
-    response = requests.get(url, timeout=60)
-    response.raise_for_status()
-    dest.write_bytes(response.content)
+def load_etags() -> Dict[str, str]:
+    try:
+        return json.loads(ETAG_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_etags(etags: Dict[str, str]) -> None:
+    ETAG_CACHE.write_text(json.dumps(etags, indent=2))
+
+
+def download_file(url: str, dest: Path, etag: Optional[str] = None) -> Optional[str]:
+    """Download ``url`` to ``dest``; returns the response ETag if any.
+
+    When the previous ETag is known and the file already exists, a
+    conditional GET is sent so an unchanged upstream file costs a single
+    304 round-trip with no body transferred.
+    """
+    headers = {}
+    if etag and dest.exists():
+        headers["If-None-Match"] = etag
+    tmp = dest.with_suffix(dest.suffix + ".part")
+    with requests.get(url, timeout=60, stream=True, headers=headers) as response:
+        if response.status_code == 304:
+            return etag
+        response.raise_for_status()
+        # Write to a temp file and rename on success so an interrupted
+        # download never leaves a truncated dataset behind.
+        try:
+            with tmp.open("wb") as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+            os.replace(tmp, dest)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return response.headers.get("ETag")
 
 
 def main() -> int:
     ensure_dir(DATA_DIR)
-    for filename, url in DATASETS.items():
-        dest_path = DATA_DIR / filename
-        print(f"Downloading {url} -> {dest_path}")
-        try:
-            download_file(url, dest_path)
-        except Exception as exc:  # noqa: BLE001
-            print(f"Failed to download {url}: {exc}", file=sys.stderr)
-            return 1
+    etags = load_etags()
+    failed = False
+    # The datasets are independent; overlap the downloads so wall time is
+    # bounded by the slowest file instead of the sum of all of them.
+    with ThreadPoolExecutor(max_workers=len(DATASETS)) as executor:
+        futures = {
+            executor.submit(
+                download_file, url, DATA_DIR / filename, etags.get(filename)
+            ): filename
+            for filename, url in DATASETS.items()
+        }
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                etag = future.result()
+                if etag:
+                    etags[filename] = etag
+                print(f"Downloaded {DATASETS[filename]}")
+            except Exception as exc:  # noqa: BLE001
+                print(f"Failed to download {DATASETS[filename]}: {exc}", file=sys.stderr)
+                failed = True
+    save_etags(etags)
+    if failed:
+        return 1
     print("All datasets downloaded.")
     return 0
 
@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+"""
+Enerji Analizleri: Kaya Gazı, Basit Kaya Gazı ve 3'lü Karşılaştırma
+EU27 vs ABD — tek giriş noktası (--analysis=shale|simple|triple|all)
+"""
+
+import argparse
+import os
+
+import pandas as pd
+import numpy as np
+# _plot_style selects the backend and applies rcParams + the seaborn
+# theme once for all analysis scripts.
+from _plot_style import PALETTE, REPORT_DPI
+from _data_loader import load_owid
+import matplotlib.pyplot as plt
+from pathlib import Path
+import warnings
+warnings.filterwarnings('ignore')
+
+class ShaleGasAnalyzer:
+    USECOLS = ['country', 'year', 'gas_consumption', 'gas_share_energy', 'gas_production']
+    DTYPES = {'country': 'category', 'year': 'float32', 'gas_consumption': 'float32',
+              'gas_share_energy': 'float32', 'gas_production': 'float32'}
+
+    def __init__(self, data_path: str = None):
+        if data_path is None:
+            data_path = Path.cwd() / 'data' / 'raw' / 'owid-energy-data.csv'
+
+        # The OWID CSV has 100+ columns; the shared loader projects the
+        # five used here and serves repeat reads from its Parquet twin
+        # and the in-process cache.
+        self.df = load_owid(data_path, tuple(self.USECOLS),
+                            tuple(self.DTYPES.items())).dropna(subset=['year'])
+        
+        # Filter for EU27 and US: one categorical map pass selects the
+        # two regions and relabels them in the same step (this also fixes
+        # the 'United States' rows never being renamed to 'US', which the
+        # region filters below expect).
+        region = self.df['country'].map({'European Union (27)': 'EU27', 'United States': 'US'})
+        mask = region.notna()
+        self.eu_us_data = (self.df.loc[mask]
+                           .assign(region=region[mask].astype('category'))
+                           .drop(columns='country'))
+        
+        # Check if data exists
+        if len(self.eu_us_data) == 0:
+            raise ValueError("No data found for EU27 and US")
+        
+        print(f"Found {len(self.eu_us_data)} records for EU27 and US")
+        
+        # Modern period (post-1990 for shale gas revolution)
+        # Read-only slice: no copy needed, the view is never written to
+        self.modern_df = self.eu_us_data[self.eu_us_data['year'] >= 1990]
+
+        # One hash-partition pass instead of a boolean scan per plot
+        # loop, materialized straight into plot-ready NumPy arrays
+        # (year as int16, values as float32, sorted so every plot gets
+        # monotonic x values). matplotlib runs np.asarray over each
+        # input it is given; handing it compact ndarrays skips that
+        # conversion on every plot call.
+        value_cols = ['gas_consumption', 'gas_share_energy', 'gas_production']
+        self._xy = {}
+        for region, group in self.modern_df.groupby('region', observed=True, sort=False):
+            group = group.sort_values('year')
+            arrays = {'year': group['year'].to_numpy(dtype=np.int16)}
+            for col in value_cols:
+                arrays[col] = group[col].to_numpy(dtype=np.float32)
+            self._xy[region] = arrays
+        self._pre_post_means = None
+        # 2024 snapshot indexed by region: one scan + index build here,
+        # O(1) .at lookups everywhere below.
+        self._latest = (self.modern_df.loc[self.modern_df['year'] == 2024]
+                        .set_index('region')
+                        [['gas_share_energy', 'gas_production', 'gas_consumption']])
+        
+        # One write instead of a syscall per line
+        print("✅ Shale Gas Analyzer initialized!\n"
+              f"📊 Data loaded: {len(self.df)} total records\n"
+              f"🌍 Regions: {', '.join(self.eu_us_data['region'].unique())}")
+    
+    def _shale_era_means(self):
+        """Mean gas share per (region, era), computed once and reused"""
+        if self._pre_post_means is None:
+            era = np.where(self.modern_df['year'].to_numpy() <= 2008, 'pre', 'post')
+            self._pre_post_means = (self.modern_df.assign(era=era)
+                                    .groupby(['region', 'era'], observed=True)['gas_share_energy']
+                                    .mean().unstack())
+        return self._pre_post_means
+
+    def _plot_consumption(self, ax):
+        """Natural gas consumption lines for both regions"""
+        for i, region in enumerate(['EU27', 'US']):
+            xy = self._xy[region]
+            ax.plot(xy['year'], xy['gas_consumption'], color=PALETTE[i],
+                    linewidth=3, marker='o', markersize=4, label=region)
+        ax.set_title('\u26fd Natural Gas Consumption (1990-2024)', fontsize=16, fontweight='bold')
+        ax.set_ylabel('Consumption (TWh)', fontsize=14)
+        ax.set_xlabel('Year', fontsize=14)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    def _plot_share(self, ax, shade=True):
+        """Gas share lines with the 2008 shale-revolution marker"""
+        for i, region in enumerate(['EU27', 'US']):
+            xy = self._xy[region]
+            ax.plot(xy['year'], xy['gas_share_energy'], color=PALETTE[i],
+                    linewidth=3, marker='s', markersize=4, label=region)
+        ax.axvline(x=2008, color='red', linestyle='--', alpha=0.7, 
+                   label='Shale Gas Revolution (2008)')
+        if shade:
+            ax.axvspan(2008, 2015, alpha=0.1, color='red')
+        ax.set_title('\u26fd Natural Gas Share in Energy Mix (1990-2024)', fontsize=16, fontweight='bold')
+        ax.set_ylabel('Energy Share (%)', fontsize=14)
+        ax.set_xlabel('Year', fontsize=14)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1f}%'))
+
+    def _plot_impact_bars(self, ax):
+        """Pre/post-2008 average gas share comparison bars"""
+        summary = self._shale_era_means()
+        regions = ['EU27', 'US']
+        pre_values = summary['pre'].reindex(regions).to_numpy(dtype=np.float32)
+        post_values = summary['post'].reindex(regions).to_numpy(dtype=np.float32)
+
+        print(f"Pre-shale values: {pre_values.tolist()}")
+        print(f"Post-shale values: {post_values.tolist()}")
+
+        # Filter out NaN pairs with one vectorized mask
+        valid = ~(np.isnan(pre_values) | np.isnan(post_values))
+        valid_regions = [region for region, keep in zip(regions, valid) if keep]
+        valid_pre_values = pre_values[valid]
+        valid_post_values = post_values[valid]
+
+        if len(valid_regions) == 0:
+            print("No valid data found for comparison")
+            return
+        
+        x = np.arange(len(valid_regions))
+        width = 0.35
+        
+        bars1 = ax.bar(x - width/2, valid_pre_values, width, label='Pre-Shale Gas (1990-2008)', 
+                       color='#2E86AB', alpha=0.8)
+        bars2 = ax.bar(x + width/2, valid_post_values, width, label='Post-Shale Gas (2009-2024)', 
+                       color='#A23B72', alpha=0.8)
+        
+        ax.set_title('\u26fd Shale Gas Impact on Natural Gas Share', fontsize=16, fontweight='bold')
+        ax.set_ylabel('Average Gas Share (%)', fontsize=14)
+        ax.set_xlabel('Region', fontsize=14)
+        ax.set_xticks(x)
+        ax.set_xticklabels(valid_regions)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        
+        # Write values on bars
+        ax.bar_label(bars1, fmt='%.1f%%', padding=3, fontweight='bold')
+        ax.bar_label(bars2, fmt='%.1f%%', padding=3, fontweight='bold')
+
+    def _plot_prod_vs_cons(self, ax):
+        """Gas production vs consumption lines for both regions"""
+        for i, region in enumerate(['EU27', 'US']):
+            xy = self._xy[region]
+            ax.plot(xy['year'], xy['gas_production'], color=PALETTE[i],
+                    linewidth=3, marker='^', markersize=4, label=f'{region} Production')
+            ax.plot(xy['year'], xy['gas_consumption'], color=PALETTE[i],
+                    linewidth=3, marker='v', markersize=4, label=f'{region} Consumption', linestyle='--')
+        
+        ax.set_title('\u26fd Gas Production vs Consumption (1990-2024)', fontsize=16, fontweight='bold')
+        ax.set_ylabel('Energy (TWh)', fontsize=14)
+        ax.set_xlabel('Year', fontsize=14)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    def _plot_2024_bars(self, ax):
+        """2024 gas metrics comparison bars"""
+        latest = self._latest
+        categories = ['Gas Share', 'Gas Production', 'Gas Consumption']
+
+        eu_values = [
+            latest.at['EU27', 'gas_share_energy'],
+            latest.at['EU27', 'gas_production'] / 100,  # Scale down
+            latest.at['EU27', 'gas_consumption'] / 100
+        ]
+        us_values = [
+            latest.at['US', 'gas_share_energy'],
+            latest.at['US', 'gas_production'] / 100,
+            latest.at['US', 'gas_consumption'] / 100
+        ]
+        
+        x = np.arange(len(categories))
+        width = 0.35
+        
+        ax.bar(x - width/2, eu_values, width, label='EU27', color='#2E86AB', alpha=0.8)
+        ax.bar(x + width/2, us_values, width, label='US', color='#A23B72', alpha=0.8)
+        
+        ax.set_title('\U0001f4ca 2024 Gas Metrics Comparison', fontsize=16, fontweight='bold')
+        ax.set_ylabel('Value', fontsize=14)
+        ax.set_xlabel('Metric', fontsize=14)
+        ax.set_xticks(x)
+        ax.set_xticklabels(categories)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    def analyze_natural_gas_trends(self):
+        """Do\u011fal gaz trendlerini analiz et"""
+        print("\n\U0001f50d Analyzing Natural Gas Trends...")
+        
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 8))
+        self._plot_consumption(ax1)
+        self._plot_share(ax2)
+        
+        plt.tight_layout()
+        plt.savefig('reports/shale_gas_analysis.png', dpi=REPORT_DPI, bbox_inches='tight',
+                    pil_kwargs={'optimize': True})
+        if os.environ.get('INTERACTIVE'):
+            plt.show()
+        plt.close(fig)
+        
+        return fig
+    
+    def analyze_shale_gas_impact(self):
+        """Shale gas etkisini analiz et"""
+        print("\n\U0001f50d Analyzing Shale Gas Impact...")
+        
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 8))
+        self._plot_impact_bars(ax1)
+        self._plot_prod_vs_cons(ax2)
+        
+        plt.tight_layout()
+        plt.savefig('reports/shale_gas_impact.png', dpi=REPORT_DPI, bbox_inches='tight',
+                    pil_kwargs={'optimize': True})
+        if os.environ.get('INTERACTIVE'):
+            plt.show()
+        plt.close(fig)
+        
+        return fig
+    
+    def create_comprehensive_analysis(self):
+        """Kapsaml\u0131 analiz olu\u015ftur"""
+        print("\n\U0001f680 Creating comprehensive shale gas analysis...")
+        
+        # Each panel is drawn exactly once, straight into the 2x2 grid;
+        # the standalone analyses share the same helpers instead of being
+        # re-rendered here.
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16))
+        self._plot_consumption(ax1)
+        self._plot_share(ax2, shade=False)
+        self._plot_prod_vs_cons(ax3)
+        self._plot_2024_bars(ax4)
+        
+        plt.tight_layout()
+        plt.savefig('reports/comprehensive_shale_gas_analysis.png', dpi=REPORT_DPI, bbox_inches='tight',
+                    pil_kwargs={'optimize': True})
+        if os.environ.get('INTERACTIVE'):
+            plt.show()
+        plt.close(fig)
+        
+        print("\U0001f4c8 Comprehensive shale gas analysis completed!")
+        return fig
+    
+    def print_statistical_summary(self):
+        """İstatistiksel özet yazdır"""
+        # Assemble the whole summary and emit it with a single write
+        lines = ["\n" + "="*80,
+                 "📊 SHALE GAS ANALYSIS STATISTICAL SUMMARY",
+                 "="*80]
+
+        latest = self._latest
+
+        for region in ['EU27', 'US']:
+            lines += [f"\n🌍 {region}:",
+                      f"   Natural Gas Share: {latest.at[region, 'gas_share_energy']:.1f}%",
+                      f"   Gas Production: {latest.at[region, 'gas_production']:.1f} TWh",
+                      f"   Gas Consumption: {latest.at[region, 'gas_consumption']:.1f} TWh"]
+
+        # Shale gas impact analysis
+        lines.append("\n🔍 SHALE GAS IMPACT ANALYSIS:")
+        summary = self._shale_era_means()
+
+        for region in ['EU27', 'US']:
+            pre_gas = summary.at[region, 'pre']
+            post_gas = summary.at[region, 'post']
+            change = post_gas - pre_gas
+
+            lines += [f"\n   {region}:",
+                      f"     Pre-Shale (1990-2008): {pre_gas:.1f}%",
+                      f"     Post-Shale (2009-2024): {post_gas:.1f}%",
+                      f"     Change: {change:+.1f}%"]
+
+        print("\n".join(lines))
+
+    def print_policy_recommendations(self):
+        """Politika önerileri yazdır"""
+        # Static text: one block, one write
+        print("\n" + "="*80 + "\n"
+              "💡 POLICY RECOMMENDATIONS FOR SHALE GAS\n"
+              + "="*80 + "\n"
+              "\n🇪🇺 For EU27:\n"
+              "   1. Shale gas development: Consider environmental regulations\n"
+              "   2. Energy security: Diversify gas supply sources\n"
+              "   3. Infrastructure: Invest in LNG terminals and pipelines\n"
+              "   4. Technology: Develop cleaner extraction methods\n"
+              "\n🇺🇸 For US:\n"
+              "   1. Shale gas leadership: Maintain technological advantage\n"
+              "   2. Export capacity: Expand LNG export infrastructure\n"
+              "   3. Environmental standards: Improve extraction practices\n"
+              "   4. Market stability: Balance domestic and export demand\n"
+              "\n🌍 General Recommendations:\n"
+              "   1. Environmental protection: Strict regulations for fracking\n"
+              "   2. Technology transfer: Share best practices globally\n"
+              "   3. Market integration: Develop global gas markets\n"
+              "   4. Transition planning: Use as bridge fuel to renewables")
+
+
+def run_shale():
+    """Kapsamlı kaya gazı analizi"""
+    print("🌍 EU27 vs ABD: Kaya Gazı (Shale Gas) Analizi")
+    print("="*60)
+    
+    try:
+        # Initialize analyzer
+        analyzer = ShaleGasAnalyzer()
+        
+        # Create comprehensive analysis
+        analyzer.create_comprehensive_analysis()
+        
+        # Print summaries
+        analyzer.print_statistical_summary()
+        analyzer.print_policy_recommendations()
+        
+        print("\n✅ Shale gas analysis completed successfully!")
+        print("📁 Reports saved in 'reports/' directory")
+        
+    except Exception as e:
+        print(f"❌ Error during analysis: {e}")
+        return 1
+    
+    return 0
+
+
+def run_simple():
+    """Basit kaya gazı analizi"""
+    print("🌍 EU27 vs ABD: Basit Kaya Gazı (Shale Gas) Analizi")
+    print("="*60)
+    
+    try:
+        # Load data (only the three columns this analysis touches) via
+        # the shared loader, which serves repeat reads from the Parquet
+        # twin of the CSV and the in-process cache
+        data_path = Path.cwd() / 'data' / 'raw' / 'owid-energy-data.csv'
+        usecols = ('country', 'year', 'gas_share_energy')
+        dtypes = (('country', 'category'), ('year', 'float32'), ('gas_share_energy', 'float32'))
+        df = load_owid(data_path, usecols, dtypes)
+        
+        print(f"✅ Data loaded: {len(df)} total records")
+        
+        # Filter for EU27 and US: one categorical map pass selects the
+        # two regions and relabels them in the same step
+        region = df['country'].map({'European Union (27)': 'EU27', 'United States': 'US'})
+        mask = region.notna()
+        eu_us_data = (df.loc[mask]
+                      .assign(region=region[mask].astype('category'))
+                      .drop(columns='country'))
+        
+        print(f"🌍 Found {len(eu_us_data)} records for EU27 and US")
+        
+        # Check available columns
+        print(f"📊 Available columns: {list(eu_us_data.columns)}")
+        
+        # Check gas data availability
+        gas_columns = [col for col in eu_us_data.columns if 'gas' in col.lower()]
+        print(f"⛽ Gas columns: {gas_columns}")
+        
+        # Check data for each region
+        for region in ['EU27', 'US']:
+            region_data = eu_us_data[eu_us_data['region'] == region]
+            print(f"\n🌍 {region}:")
+            print(f"   Records: {len(region_data)}")
+            if 'gas_share_energy' in region_data.columns:
+                gas_data = region_data['gas_share_energy'].dropna()
+                print(f"   Gas share data: {len(gas_data)} records")
+                if len(gas_data) > 0:
+                    print(f"   Years: {gas_data.index.min()} - {gas_data.index.max()}")
+        
+        # Create simple visualization if data exists
+        if 'gas_share_energy' in eu_us_data.columns:
+            print("\n📈 Creating gas share visualization...")
+            
+            # Filter for years with data
+            gas_data = eu_us_data[eu_us_data['gas_share_energy'].notna()]
+            
+            if len(gas_data) > 0:
+                fig, ax = plt.subplots(figsize=(14, 8))
+                
+                for i, region in enumerate(gas_data['region'].unique()):
+                    region_data = gas_data[gas_data['region'] == region]
+                    ax.plot(region_data['year'], region_data['gas_share_energy'],
+                           color=PALETTE[i], linewidth=3, marker='o', markersize=4, label=region)
+                
+                ax.set_title('⛽ Natural Gas Share in Energy Mix', fontsize=16, fontweight='bold')
+                ax.set_ylabel('Energy Share (%)', fontsize=14)
+                ax.set_xlabel('Year', fontsize=14)
+                ax.legend()
+                ax.grid(True, alpha=0.3)
+                ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1f}%'))
+                
+                plt.tight_layout()
+                plt.savefig('reports/simple_gas_analysis.png', dpi=REPORT_DPI, bbox_inches='tight',
+                            pil_kwargs={'optimize': True})
+                if os.environ.get('INTERACTIVE'):
+                    plt.show()
+                plt.close(fig)
+                
+                print("✅ Visualization created successfully!")
+            else:
+                print("❌ No gas data available for visualization")
+        else:
+            print("❌ Gas share column not found in data")
+        
+        print("\n✅ Simple shale gas analysis completed!")
+        
+    except Exception as e:
+        print(f"❌ Error during analysis: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+def run_triple():
+    """3'lü karşılaştırma analizi"""
+    print("🌍 EU27 vs ABD: 3'lü Enerji Karşılaştırması")
+    print("="*60)
+    print("📊 Nükleer + Yenilenebilir + Kaya Gazı Analizi")
+    
+    try:
+        # Load processed data (only the columns plotted here) via the
+        # shared loader; it prefers the Parquet copy process_data.py
+        # publishes next to the CSV and caches the frame in-process.
+        data_path = Path.cwd() / 'data' / 'processed' / 'eu_us_energy.csv'
+        usecols = ('region', 'year', 'nuclear_share_energy',
+                   'renewables_share_energy', 'low_carbon_share_energy')
+        dtypes = tuple((col, 'float32') for col in usecols[1:])
+        df = load_owid(data_path, usecols, dtypes).dropna(subset=['year'])
+        
+        print(f"✅ Processed data loaded: {len(df)} records")
+        
+        # Filter for modern period
+        modern_df = df[df['year'] >= 1990]
+        
+        # Create comprehensive comparison
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16))
+        
+        # 1. Nuclear Energy Trends
+        for i, region in enumerate(['EU27', 'US']):
+            data = modern_df[modern_df['region'] == region]
+            ax1.plot(data['year'], data['nuclear_share_energy'], color=PALETTE[i],
+                    linewidth=3, marker='o', markersize=4, label=region)
+        
+        ax1.set_title('⚛️ Nuclear Energy Share (1990-2024)', fontsize=16, fontweight='bold')
+        ax1.set_ylabel('Energy Share (%)', fontsize=14)
+        ax1.set_xlabel('Year', fontsize=14)
+        ax1.legend()
+        ax1.grid(True, alpha=0.3)
+        ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1f}%'))
+        
+        # 2. Renewable Energy Trends
+        for i, region in enumerate(['EU27', 'US']):
+            data = modern_df[modern_df['region'] == region]
+            ax2.plot(data['year'], data['renewables_share_energy'], color=PALETTE[i],
+                    linewidth=3, marker='s', markersize=4, label=region)
+        
+        ax2.set_title('🌱 Renewable Energy Share (1990-2024)', fontsize=16, fontweight='bold')
+        ax2.set_ylabel('Energy Share (%)', fontsize=14)
+        ax2.set_xlabel('Year', fontsize=14)
+        ax2.legend()
+        ax2.grid(True, alpha=0.3)
+        ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1f}%'))
+        
+        # 3. Gas Energy Trends (Shale Gas)
+        # Load raw data for gas information
+        raw_data_path = Path.cwd() / 'data' / 'raw' / 'owid-energy-data.csv'
+        # The PDF pipeline persists exactly this subset (EU27/US,
+        # >=1990, gas share) as Parquet next to the raw CSV; reuse it
+        # when fresh so the big CSV is not touched at all.
+        gas_cache = raw_data_path.with_name('owid-energy-gas-eu-us.parquet')
+        eu_us_gas = None
+        try:
+            if gas_cache.stat().st_mtime >= raw_data_path.stat().st_mtime:
+                eu_us_gas = (pd.read_parquet(gas_cache)
+                             .rename(columns={'country': 'region'}))
+        except (ImportError, OSError):
+            pass
+        if eu_us_gas is None:
+            raw_usecols = ('country', 'year', 'gas_share_energy')
+            raw_dtypes = (('country', 'category'), ('year', 'float32'),
+                          ('gas_share_energy', 'float32'))
+            raw_df = load_owid(raw_data_path, raw_usecols, raw_dtypes).dropna(subset=['year'])
+
+            # Filter for EU27 and US gas data: one categorical map pass
+            # selects the two regions and relabels them in the same step
+            gas_region = raw_df['country'].map({'European Union (27)': 'EU27', 'United States': 'US'})
+            gas_mask = gas_region.notna()
+            eu_us_gas = (raw_df.loc[gas_mask]
+                         .assign(region=gas_region[gas_mask].astype('category'))
+                         .drop(columns='country'))
+        
+        gas_modern = eu_us_gas[eu_us_gas['year'] >= 1990]
+        
+        for i, region in enumerate(gas_modern['region'].unique()):
+            region_data = gas_modern[gas_modern['region'] == region]
+            if 'gas_share_energy' in region_data.columns:
+                gas_data = region_data[region_data['gas_share_energy'].notna()]
+                if len(gas_data) > 0:
+                    ax3.plot(gas_data['year'], gas_data['gas_share_energy'],
+                            color=PALETTE[i], linewidth=3, marker='^', markersize=4,
+                            label=f'{region} Gas')
+        
+        # Shale gas revolution marker
+        ax3.axvline(x=2008, color='red', linestyle='--', alpha=0.7, 
+                   label='Shale Gas Revolution (2008)')
+        ax3.axvspan(2008, 2015, alpha=0.1, color='red')
+        
+        ax3.set_title('⛽ Natural Gas Share (1990-2024)', fontsize=16, fontweight='bold')
+        ax3.set_ylabel('Energy Share (%)', fontsize=14)
+        ax3.set_xlabel('Year', fontsize=14)
+        ax3.legend()
+        ax3.grid(True, alpha=0.3)
+        ax3.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1f}%'))
+        
+        # 4. 2024 Comparison (region-indexed snapshot: one scan, then
+        # O(1) lookups here and in the summary below)
+        latest = modern_df[modern_df['year'] == 2024].set_index('region')
+        categories = ['Nuclear', 'Renewable', 'Low Carbon']
+
+        eu_values = [
+            latest.at['EU27', 'nuclear_share_energy'],
+            latest.at['EU27', 'renewables_share_energy'],
+            latest.at['EU27', 'low_carbon_share_energy']
+        ]
+        us_values = [
+            latest.at['US', 'nuclear_share_energy'],
+            latest.at['US', 'renewables_share_energy'],
+            latest.at['US', 'low_carbon_share_energy']
+        ]
+        
+        x = np.arange(len(categories))
+        width = 0.35
+        
+        bars1 = ax4.bar(x - width/2, eu_values, width, label='EU27', color='#2E86AB', alpha=0.8)
+        bars2 = ax4.bar(x + width/2, us_values, width, label='US', color='#A23B72', alpha=0.8)
+        
+        ax4.set_title('📊 2024 Energy Mix Comparison', fontsize=16, fontweight='bold')
+        ax4.set_ylabel('Energy Share (%)', fontsize=14)
+        ax4.set_xlabel('Energy Source', fontsize=14)
+        ax4.set_xticks(x)
+        ax4.set_xticklabels(categories)
+        ax4.legend()
+        ax4.grid(True, alpha=0.3)
+        
+        # Write values on bars
+        ax4.bar_label(bars1, fmt='%.1f%%', padding=3, fontweight='bold')
+        ax4.bar_label(bars2, fmt='%.1f%%', padding=3, fontweight='bold')
+        
+        plt.tight_layout()
+        plt.savefig('reports/triple_comparison_analysis.png', dpi=REPORT_DPI, bbox_inches='tight',
+                    pil_kwargs={'optimize': True})
+        if os.environ.get('INTERACTIVE'):
+            plt.show()
+        plt.close(fig)
+        
+        # Print summary
+        print("\n" + "="*80)
+        print("📊 3'LÜ ENERJİ KARŞILAŞTIRMASI ÖZETİ")
+        print("="*80)
+        
+        print(f"\n🌍 2024 Yılı Karşılaştırması:")
+        for region in ['EU27', 'US']:
+            print(f"\n   {region}:")
+            print(f"     ⚛️ Nükleer: {latest.at[region, 'nuclear_share_energy']:.1f}%")
+            print(f"     🌱 Yenilenebilir: {latest.at[region, 'renewables_share_energy']:.1f}%")
+            print(f"     🔋 Düşük Karbon: {latest.at[region, 'low_carbon_share_energy']:.1f}%")
+        
+        print(f"\n🔍 Trend Analizi (1990-2024):")
+        for region in ['EU27', 'US']:
+            region_data = modern_df[modern_df['region'] == region]
+            nuclear_change = region_data.iloc[-1]['nuclear_share_energy'] - region_data.iloc[0]['nuclear_share_energy']
+            renewables_change = region_data.iloc[-1]['renewables_share_energy'] - region_data.iloc[0]['renewables_share_energy']
+            
+            print(f"\n   {region}:")
+            print(f"     ⚛️ Nükleer: {nuclear_change:+.1f}%")
+            print(f"     🌱 Yenilenebilir: {renewables_change:+.1f}%")
+        
+        print(f"\n💡 Ana Bulgular:")
+        print(f"   1. EU27 yenilenebilir enerjide lider")
+        print(f"   2. ABD nükleer enerjide daha istikrarlı")
+        print(f"   3. Kaya gazı devrimi (2008) ABD'de etkili")
+        print(f"   4. Her iki bölge de düşük karbon geçişinde ilerliyor")
+        
+        print("\n✅ 3'lü karşılaştırma analizi tamamlandı!")
+        print("📁 Rapor 'reports/triple_comparison_analysis.png' olarak kaydedildi")
+        
+    except Exception as e:
+        print(f"❌ Error during analysis: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+_RUNNERS = {'shale': run_shale, 'simple': run_simple, 'triple': run_triple}
+
+
+def main(analysis=None):
+    """Ana fonksiyon: istenen analizleri tek süreçte çalıştır"""
+    if analysis is None:
+        parser = argparse.ArgumentParser(
+            description="EU27 vs ABD enerji analizleri (tek süreçte)")
+        parser.add_argument('--analysis', choices=[*_RUNNERS, 'all'], default='all',
+                            help='çalıştırılacak analiz (varsayılan: all)')
+        analysis = parser.parse_args().analysis
+
+    # One process pays the seaborn/matplotlib import cost once, and the
+    # load_owid cache is shared by every analysis that runs.
+    runs = _RUNNERS.values() if analysis == 'all' else [_RUNNERS[analysis]]
+    status = 0
+    for run in runs:
+        status = run() or status
+    return status
+
+
+if __name__ == "__main__":
+    exit(main())
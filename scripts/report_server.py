@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+"""Persistent report worker for repeated PDF generation.
+
+For one-off runs ``generate_pdf_reports.py`` is fine, but when reports
+are rebuilt repeatedly (cron, dashboards) the matplotlib/reportlab
+imports and data load dominate each invocation. This worker pays those
+once: it pre-warms the data and charts at startup, then listens on a
+Unix domain socket and only runs ``doc.build`` per request.
+
+Usage:
+    python scripts/report_server.py serve    # start the worker
+    python scripts/report_server.py build    # ask it to rebuild the PDFs
+    python scripts/report_server.py ping     # health check
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+SOCKET_PATH = Path(os.environ.get("REPORT_SOCKET", "/tmp/energy_report_worker.sock"))
+MAX_MESSAGE = 1 << 16
+
+
+def _handle(generator, charts, request):
+    command = request.get("command", "build")
+    if command == "ping":
+        return {"ok": True}
+    if command == "build":
+        try:
+            generator.generate_english_report(charts)
+            generator.generate_turkish_report(charts)
+            return {"ok": True, "reports": [
+                "detailed_energy_analysis_report_en.pdf",
+                "detailed_energy_analysis_report_tr.pdf",
+            ]}
+        except Exception as exc:  # noqa: BLE001
+            return {"ok": False, "error": str(exc)}
+    return {"ok": False, "error": f"unknown command {command!r}"}
+
+
+def serve() -> int:
+    # Heavy imports happen here, once for the worker's lifetime.
+    from generate_pdf_reports import PDFReportGenerator
+
+    generator = PDFReportGenerator()
+    if not generator.load_data():
+        return 1
+    charts = generator.create_comprehensive_charts()
+
+    SOCKET_PATH.unlink(missing_ok=True)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(SOCKET_PATH))
+        server.listen(1)
+        print(f"Report worker listening on {SOCKET_PATH}")
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    request = json.loads(conn.recv(MAX_MESSAGE) or b"{}")
+                    conn.sendall(json.dumps(_handle(generator, charts, request)).encode())
+        finally:
+            SOCKET_PATH.unlink(missing_ok=True)
+
+
+def send(command: str) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(SOCKET_PATH))
+        client.sendall(json.dumps({"command": command}).encode())
+        return json.loads(client.recv(MAX_MESSAGE))
+
+
+def main() -> int:
+    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if command == "serve":
+        return serve()
+    if command in ("build", "ping"):
+        try:
+            response = send(command)
+        except (OSError, ValueError) as exc:
+            print(f"Worker unreachable at {SOCKET_PATH}: {exc}", file=sys.stderr)
+            return 1
+        print(json.dumps(response))
+        return 0 if response.get("ok") else 1
+    print(f"Unknown command: {command}", file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())